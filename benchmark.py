@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""Mede o desempenho da carga da base de candidatos."""
+
+import argparse
+import csv
+import datetime
+import itertools
+import json
+import operator
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import main
+
+# Partidos usados na base sintética.
+PARTIDOS = [
+    (10, 'PRB', 'Partido Republicano Brasileiro'),
+    (11, 'PP', 'Partido Progressista'),
+    (12, 'PDT', 'Partido Democrático Trabalhista'),
+    (13, 'PT', 'Partido dos Trabalhadores'),
+    (14, 'PTB', 'Partido Trabalhista Brasileiro'),
+    (15, 'PMDB', 'Partido do Movimento Democrático Brasileiro'),
+    (20, 'PSC', 'Partido Social Cristão'),
+    (22, 'PR', 'Partido da República'),
+    (23, 'PPS', 'Partido Popular Socialista'),
+    (25, 'DEM', 'Democratas'),
+    (31, 'PHS', 'Partido Humanista da Solidariedade'),
+    (40, 'PSB', 'Partido Socialista Brasileiro'),
+    (45, 'PSDB', 'Partido da Social Democracia Brasileira'),
+    (50, 'PSOL', 'Partido Socialismo e Liberdade'),
+    (55, 'PSD', 'Partido Social Democrático'),
+    (65, 'PC do B', 'Partido Comunista do Brasil'),
+]
+
+# Código do primeiro município da base sintética, o do Rio de Janeiro, que
+# tem dados de referência.
+CODIGO_MUNICIPIO_RJ = 60011
+
+# Cargos da base sintética, com a proporção de candidatos de cada um.
+CARGOS = [(11, 'PREFEITO', 0.05), (13, 'VEREADOR', 0.95)]
+
+
+def gera_base_sintetica(caminho,
+                        municipios=10,
+                        zonas=5,
+                        candidatos=100,
+                        coligacoes=5,
+                        sigla_uf='RJ',
+                        semente=0,
+                        descricao_eleicao='ELEIÇÕES MUNICIPAIS 2016'):
+    """Escreve uma base no formato VOTACAO_CANDIDATO_MUN_ZONA do TSE.
+
+    Cada município tem suas próprias zonas eleitorais, candidatos e
+    coligações. Cada candidato tem uma linha por zona do seu município. As
+    composições das coligações têm apenas partidos com candidatos, que
+    precisam estar na base para a composição ser inserida.
+    Retorna o número de linhas escritas.
+    """
+    aleatorio = random.Random(semente)
+    pesos_cargos = [proporcao for _, _, proporcao in CARGOS]
+    linhas = 0
+    with open(caminho, 'w', newline='', encoding='ISO-8859-1') as saida:
+        escritor = csv.writer(
+            saida, delimiter=';', quoting=csv.QUOTE_ALL, lineterminator='\n')
+        for indice_municipio in range(municipios):
+            codigo_municipio = CODIGO_MUNICIPIO_RJ + indice_municipio
+            nome_municipio = 'MUNICÍPIO {}'.format(indice_municipio)
+            composicoes = [
+                aleatorio.sample(PARTIDOS, aleatorio.randint(1, 4))
+                for _ in range(coligacoes)
+            ]
+            primeira_zona = indice_municipio * zonas + 1
+
+            # Os candidatos são sorteados antes de escrever as linhas, para
+            # que as composições possam perder os partidos sem candidatos.
+            candidaturas = []
+            for _ in range(candidatos):
+                cargo = aleatorio.choices(CARGOS, pesos_cargos)[0]
+                indice_coligacao = aleatorio.randrange(coligacoes)
+                partido = aleatorio.choice(composicoes[indice_coligacao])
+                votos = [aleatorio.randint(0, 5000) for _ in range(zonas)]
+                candidaturas.append(
+                    (cargo, indice_coligacao, partido, votos))
+            com_candidatos = {(indice_coligacao, partido)
+                              for _, indice_coligacao, partido, _ in
+                              candidaturas}
+            siglas_composicoes = [
+                ' / '.join(partido[1] for partido in composicao
+                           if (indice_coligacao, partido) in com_candidatos)
+                for indice_coligacao, composicao in enumerate(composicoes)
+            ]
+
+            for indice_candidato, (cargo, indice_coligacao, partido,
+                                   votos) in enumerate(candidaturas):
+                codigo_cargo, descricao_cargo, _ = cargo
+                for numero_zona, total_votos in enumerate(
+                        votos, primeira_zona):
+                    escritor.writerow([
+                        '02/06/2017', '19:36:40', 2016, 1,
+                        descricao_eleicao, sigla_uf,
+                        codigo_municipio, codigo_municipio, nome_municipio,
+                        numero_zona, codigo_cargo,
+                        partido[0] * 1000 + indice_candidato,
+                        10000000000 + indice_candidato,
+                        'CANDIDATO {} DE SÃO JOÃO'.format(indice_candidato),
+                        'CANDIDATO {}'.format(indice_candidato),
+                        descricao_cargo, 12, 'APTO', 2, 'DEFERIDO', 1,
+                        'ELEITO', partido[0], partido[1], partido[2],
+                        codigo_municipio * 1000 + indice_coligacao,
+                        'COLIGAÇÃO {}'.format(indice_coligacao),
+                        siglas_composicoes[indice_coligacao], total_votos,
+                        'N'
+                    ])
+                    linhas += 1
+    return linhas
+
+
+def gera_base_dividida(diretorio, municipios, zonas, candidatos,
+                       coligacoes):
+    """Escreve uma base sintética dividida em dois arquivos no diretório.
+
+    A divisão é no meio de um município, e as linhas do segundo arquivo têm
+    outra descrição da eleição, como arquivos do TSE gerados em datas
+    diferentes. Retorna os caminhos dos arquivos.
+    """
+    caminhos = []
+    for indice, descricao in enumerate(
+            ['ELEIÇÕES MUNICIPAIS 2016', 'ELEIÇÃO MUNICIPAL 2016']):
+        caminhos.append(
+            os.path.join(diretorio, 'sintetica_{}.txt'.format(indice)))
+        gera_base_sintetica(caminhos[-1], municipios, zonas, candidatos,
+                            coligacoes, descricao_eleicao=descricao)
+
+    linhas_municipio = zonas * candidatos
+    divisao = municipios // 2 * linhas_municipio + linhas_municipio // 2
+    for indice, caminho in enumerate(caminhos):
+        with open(caminho, encoding='ISO-8859-1') as entrada:
+            linhas = entrada.readlines()
+        with open(caminho, 'w', encoding='ISO-8859-1') as saida:
+            saida.writelines(linhas[divisao:] if indice else linhas[:divisao])
+    return caminhos
+
+
+def mede_etapa(medidas, nome, executa_etapa):
+    """Executa uma etapa, registrando seu tempo e o pico de memória."""
+    inicio = time.perf_counter()
+    retorno = executa_etapa()
+    medidas[nome] = {
+        'segundos': time.perf_counter() - inicio,
+        'pico_rss_mb': main.pico_rss_mb()
+    }
+    return retorno
+
+
+def mede_carga(arquivos, tamanho_lote, conversao_parcial):
+    """Mede separadamente cada etapa da carga dos arquivos em SQLite.
+
+    As etapas são a leitura da base (carrega), a normalização (recupera) e
+    a inserção em uma database SQLite em memória (insere). Para isolar as
+    etapas, o resultado de cada uma é mantido em memória até a seguinte.
+    Retorna o número de linhas e um dict do nome da etapa para suas medidas.
+    """
+    medidas = {}
+    base_candidato = mede_etapa(medidas, 'carrega', lambda: [
+        dados for arquivo in arquivos
+        for dados in main.carrega_base_candidato(arquivo, conversao_parcial)
+    ])
+    linhas = len(base_candidato)
+
+    dimensoes = main.Dimensoes()
+    lotes = mede_etapa(
+        medidas, 'recupera', lambda: list(
+            main.recupera_votacoes(base_candidato, dimensoes, tamanho_lote)))
+    del base_candidato
+
+    main.configura_engine('sqlite://')
+    main.METADATA.create_all(main.obtem_engine())
+
+    def insere():
+        carregador = main.CarregadorEmLotes(tamanho_lote)
+        for votacoes in lotes:
+            main.insere_dimensoes(dimensoes, carregador)
+            main.insere_votacoes(votacoes, carregador)
+        main.insere_composicoes(dimensoes.coligacao_por_numero,
+                                dimensoes.partido_por_sigla, carregador)
+        carregador.finaliza()
+
+    mede_etapa(medidas, 'insere', insere)
+
+    for medida in medidas.values():
+        medida['linhas_por_segundo'] = linhas / medida['segundos']
+    return linhas, medidas
+
+
+def compara_com_historico(caminho, registro):
+    """Mostra as medidas, comparando com a última de mesmos parâmetros.
+
+    O registro é acrescentado ao histórico em caminho, um JSON por linha.
+    """
+    anterior = None
+    if os.path.exists(caminho):
+        with open(caminho, encoding='utf-8') as historico:
+            for linha in historico:
+                medida = json.loads(linha)
+                if medida['parametros'] == registro['parametros']:
+                    anterior = medida
+
+    for etapa, medidas in registro['etapas'].items():
+        texto = '{:10} {:8.2f} s {:12.0f} linhas/s {:8.1f} MB'.format(
+            etapa, medidas['segundos'], medidas['linhas_por_segundo'],
+            medidas['pico_rss_mb'])
+        if anterior is not None and etapa in anterior['etapas']:
+            taxa_anterior = anterior['etapas'][etapa]['linhas_por_segundo']
+            if taxa_anterior:
+                texto += ' ({:+.1%})'.format(
+                    medidas['linhas_por_segundo'] / taxa_anterior - 1)
+        print(texto)
+
+    with open(caminho, 'a', encoding='utf-8') as historico:
+        historico.write(json.dumps(registro, sort_keys=True) + '\n')
+
+
+def mede_leitura(arquivos, conversao_parcial, repeticoes):
+    """Lê os arquivos, retornando o número de linhas e a melhor taxa."""
+    melhor_taxa = 0
+    for _ in range(repeticoes):
+        linhas = 0
+        inicio = time.perf_counter()
+        for arquivo in arquivos:
+            for _ in main.carrega_base_candidato(arquivo, conversao_parcial):
+                linhas += 1
+        duracao = time.perf_counter() - inicio
+        melhor_taxa = max(melhor_taxa, linhas / duracao)
+    return linhas, melhor_taxa
+
+
+def memoria_retida(constroi):
+    """Retorna os bytes alocados e mantidos pelo objeto criado por constroi."""
+    tracemalloc.start()
+    objeto = constroi()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objeto
+    return memoria
+
+
+def mede_memoria_votacoes(arquivos):
+    """Compara a memória das votações em lista de Votacao e em colunas.
+
+    Retorna os bytes ocupados por todas as votações dos arquivos em cada
+    representação.
+    """
+    lotes = main.recupera_arquivos(arquivos, main.Dimensoes(), sys.maxsize, 1,
+                                   True)
+    votacoes = next(lotes, main.VotacoesColunares())
+    em_lista = memoria_retida(lambda: list(votacoes))
+    em_colunas = memoria_retida(
+        lambda: pickle.loads(pickle.dumps(votacoes, pickle.HIGHEST_PROTOCOL)))
+    return em_lista, em_colunas
+
+
+def recupera(arquivos, tamanho_lote, vetorizado):
+    """Recupera os arquivos, retornando as dimensões e os lotes de votações.
+    """
+    dimensoes = main.Dimensoes()
+    lotes = list(
+        main.recupera_arquivos(arquivos, dimensoes, tamanho_lote, 1, True,
+                               vetorizado=vetorizado))
+    return dimensoes, lotes
+
+
+def diferencas(esperado, obtido):
+    """Retorna os nomes das tabelas que diferem entre duas recuperações.
+
+    esperado e obtido são (dimensoes, lotes), como retornados por recupera.
+    """
+    nomes = []
+    for nome in ('eleicoes_por_id', 'candidato_por_chave', 'cargos',
+                 'municipios', 'partido_por_sigla', 'coligacao_por_numero'):
+        colecao_esperada = getattr(esperado[0], nome)
+        colecao_obtida = getattr(obtido[0], nome)
+        if isinstance(colecao_esperada, dict):
+            # A ordem dos dicts é a de inserção na database.
+            colecao_esperada = list(colecao_esperada.items())
+            colecao_obtida = list(colecao_obtida.items())
+        if colecao_esperada != colecao_obtida:
+            nomes.append(nome)
+    if not all(
+            itertools.starmap(
+                operator.eq,
+                itertools.zip_longest(
+                    itertools.chain.from_iterable(esperado[1]),
+                    itertools.chain.from_iterable(obtido[1])))):
+        nomes.append('votacoes')
+    return nomes
+
+
+def executa_vetorizado(argumentos):
+    """Compara a recuperação vetorizada com a linha a linha.
+
+    Sem arquivos, usa uma base sintética dividida por gera_base_dividida.
+    """
+    resultados = {}
+    duracoes = {}
+    with tempfile.TemporaryDirectory(prefix='tp2_ibd_') as diretorio:
+        if argumentos.arquivos:
+            arquivos = main.lista_arquivos(argumentos.arquivos)
+        else:
+            arquivos = gera_base_dividida(
+                diretorio, argumentos.municipios, argumentos.zonas,
+                argumentos.candidatos, argumentos.coligacoes)
+        for vetorizado in (False, True):
+            duracoes[vetorizado] = float('inf')
+            for _ in range(argumentos.repeticoes):
+                inicio = time.perf_counter()
+                resultados[vetorizado] = recupera(arquivos,
+                                                  argumentos.tamanho_lote,
+                                                  vetorizado)
+                duracoes[vetorizado] = min(duracoes[vetorizado],
+                                           time.perf_counter() - inicio)
+
+    linhas = resultados[False][0].total_votacoes
+    print('{} linhas'.format(linhas))
+    print('linha a linha:      {:12.0f} linhas/s'.format(
+        linhas / duracoes[False]))
+    print('vetorizada:         {:12.0f} linhas/s ({:.2f}x)'.format(
+        linhas / duracoes[True], duracoes[False] / duracoes[True]))
+
+    nomes = diferencas(resultados[False], resultados[True])
+    if nomes:
+        sys.exit('Recuperações diferentes em: {}'.format(', '.join(nomes)))
+    print('recuperações equivalentes')
+
+
+def executa_leitura(argumentos):
+    """Compara os modos de conversão e a memória das votações."""
+    arquivos = main.lista_arquivos(argumentos.arquivos)
+
+    linhas, taxa_completa = mede_leitura(arquivos, False,
+                                         argumentos.repeticoes)
+    _, taxa_parcial = mede_leitura(arquivos, True, argumentos.repeticoes)
+
+    print('{} linhas'.format(linhas))
+    print('conversão completa: {:12.0f} linhas/s'.format(taxa_completa))
+    print('conversão parcial:  {:12.0f} linhas/s ({:.2f}x)'.format(
+        taxa_parcial, taxa_parcial / taxa_completa))
+
+    em_lista, em_colunas = mede_memoria_votacoes(arquivos)
+    print('votações em lista:  {:12.1f} bytes/linha'.format(em_lista / linhas))
+    print('votações em colunas:{:12.1f} bytes/linha ({:.1%})'.format(
+        em_colunas / linhas, em_colunas / em_lista))
+
+
+def executa_carga(argumentos):
+    """Mede as etapas da carga dos arquivos dados ou de uma base sintética."""
+    parametros = {
+        'tamanho_lote': argumentos.tamanho_lote,
+        'conversao_parcial': not argumentos.conversao_completa
+    }
+    with tempfile.TemporaryDirectory(prefix='tp2_ibd_') as diretorio:
+        if argumentos.arquivos:
+            arquivos = main.lista_arquivos(argumentos.arquivos)
+            parametros['arquivos'] = [
+                str(arquivo._replace(caminho=os.path.abspath(arquivo.caminho)))
+                if isinstance(arquivo, main.MembroZip) else
+                os.path.abspath(arquivo) for arquivo in arquivos
+            ]
+        else:
+            arquivos = [os.path.join(diretorio, 'sintetica.txt')]
+            parametros.update(
+                municipios=argumentos.municipios,
+                zonas=argumentos.zonas,
+                candidatos=argumentos.candidatos,
+                coligacoes=argumentos.coligacoes)
+            gera_base_sintetica(arquivos[0], argumentos.municipios,
+                                argumentos.zonas, argumentos.candidatos,
+                                argumentos.coligacoes)
+
+        linhas, etapas = mede_carga(arquivos, argumentos.tamanho_lote,
+                                    not argumentos.conversao_completa)
+
+    print('{} linhas'.format(linhas))
+    compara_com_historico(argumentos.historico, {
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'linhas': linhas,
+        'parametros': parametros,
+        'etapas': etapas
+    })
+
+
+def executa_geracao(argumentos):
+    """Gera uma base sintética."""
+    linhas = gera_base_sintetica(
+        argumentos.saida, argumentos.municipios, argumentos.zonas,
+        argumentos.candidatos, argumentos.coligacoes, argumentos.sigla_uf,
+        argumentos.semente)
+    print('{} linhas escritas em {}'.format(linhas, argumentos.saida))
+
+
+def adiciona_argumentos_base(parser):
+    """Adiciona os argumentos de tamanho da base sintética."""
+    parser.add_argument(
+        '--municipios',
+        type=int,
+        default=10,
+        help='municípios da base sintética (padrão: %(default)s)')
+    parser.add_argument(
+        '--zonas',
+        type=int,
+        default=5,
+        help='zonas eleitorais por município (padrão: %(default)s)')
+    parser.add_argument(
+        '--candidatos',
+        type=int,
+        default=100,
+        help='candidatos por município (padrão: %(default)s)')
+    parser.add_argument(
+        '--coligacoes',
+        type=int,
+        default=5,
+        help='coligações por município (padrão: %(default)s)')
+
+
+def le_argumentos():
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest='comando')
+    subparsers.required = True
+
+    leitura = subparsers.add_parser(
+        'leitura',
+        help='compara os modos de conversão e a memória das votações')
+    leitura.add_argument(
+        'arquivos',
+        nargs='+',
+        help='arquivos VOTACAO_CANDIDATO_MUN_ZONA do TSE ou diretórios que '
+        'os contenham')
+    leitura.add_argument(
+        '--repeticoes',
+        type=int,
+        default=3,
+        help='vezes que cada leitura é repetida (padrão: %(default)s)')
+    leitura.set_defaults(executa=executa_leitura)
+
+    carga = subparsers.add_parser(
+        'carga',
+        help='mede cada etapa da carga em SQLite, comparando com a última '
+        'medida com os mesmos parâmetros')
+    carga.add_argument(
+        'arquivos',
+        nargs='*',
+        help='arquivos a carregar; sem arquivos, gera uma base sintética')
+    adiciona_argumentos_base(carga)
+    carga.add_argument(
+        '--tamanho-lote',
+        type=int,
+        default=main.TAMANHO_LOTE_PADRAO,
+        help='linhas por lote (padrão: %(default)s)')
+    carga.add_argument(
+        '--conversao-completa',
+        action='store_true',
+        help='converte todas as colunas da base')
+    carga.add_argument(
+        '--historico',
+        default='benchmark_historico.jsonl',
+        help='arquivo com as medidas anteriores (padrão: %(default)s)')
+    carga.set_defaults(executa=executa_carga)
+
+    vetorizado = subparsers.add_parser(
+        'vetorizado',
+        help='verifica se a recuperação vetorizada é equivalente à linha a '
+        'linha e compara suas taxas')
+    vetorizado.add_argument(
+        'arquivos',
+        nargs='*',
+        help='arquivos VOTACAO_CANDIDATO_MUN_ZONA do TSE ou diretórios que '
+        'os contenham; sem arquivos, gera uma base sintética dividida em '
+        'dois arquivos')
+    adiciona_argumentos_base(vetorizado)
+    vetorizado.add_argument(
+        '--tamanho-lote',
+        type=int,
+        default=main.TAMANHO_LOTE_PADRAO,
+        help='linhas por lote (padrão: %(default)s)')
+    vetorizado.add_argument(
+        '--repeticoes',
+        type=int,
+        default=3,
+        help='vezes que cada recuperação é repetida (padrão: %(default)s)')
+    vetorizado.set_defaults(executa=executa_vetorizado)
+
+    geracao = subparsers.add_parser('gera', help='gera uma base sintética')
+    geracao.add_argument('saida', help='arquivo a ser escrito')
+    adiciona_argumentos_base(geracao)
+    geracao.add_argument(
+        '--sigla-uf', default='RJ', help='UF da base (padrão: %(default)s)')
+    geracao.add_argument(
+        '--semente',
+        type=int,
+        default=0,
+        help='semente dos dados aleatórios (padrão: %(default)s)')
+    geracao.set_defaults(executa=executa_geracao)
+
+    return parser.parse_args()
+
+
+def executa():
+    """Ponto de entrada do programa."""
+    argumentos = le_argumentos()
+    argumentos.executa(argumentos)
+
+
+if __name__ == '__main__':
+    executa()
@@ -1,285 +0,0 @@
-## áreas administrativas do rio com populacao https://pt.wikipedia.org/wiki/Regi%C3%B5es_administrativas_da_cidade_do_Rio_de_Janeiro
-aa = """1-caju,gamboa,santo cristo,saude-48664;
-2-centro,gloria,lapa-41142;
-3-catumbi,cidade nova,estacio,rio comprido-78975;
-4-botafogo,catete,cosme velho,flamengo,humaita,laranjeiras,urca-239739;
-5-copacabana,leme-161191;
-6-gavea,ipanema,jardim botanico,lagoa,leblon,sao conrado,vidigal-167774;
-7-benfica,mangueira,sao cristovao,vasco da gama-84908;
-8-alto da boa vista,praca da bandeira,tijuca-183810;
-9-andarai,grajau,maracana,vila isabel-189310;
-10-bonsucesso,manguinhos,olaria,ramos-153177;
-11-bras de pina,penha,penha circular-144810;
-12-del castilho,engenho da rainha,inhauma,higienopolis,maria da graca,tomas coelho-138472;
-13-abolicao,agua santa,cachambi,encantado,engenho de dentro,engenho novo,jacare,lins de vasconcelos,meier,piedade,pilares,riachuelo,rocha,sampaio,sao francisco xavier,todos os santos-463639;
-14-colegio,iraja,vicente de carvalho,vila da penha,vila kosmos,vista alegre-261442;
-15-bento ribeiro,campinho,cascadura,cavalcante,engenheiro leal,honorio gurgel,madureira,marechal hermes,oswaldo cruz,quintino bocaiuva,rocha miranda,turiacu,vaz lobo-351470;
-16-anil,curicica,freguesia de jacarepagua,gardenia azul,jacarepagua,pechincha,praca seca,tanque,taquara,vila valqueire-648056;
-17-bangu,gericino,padre miguel,senador camara-488645;
-18-campo grande,cosmos,inhoaiba,senador vasconcelos,santissimo-546482;
-19-santa cruz,paciencia,sepetiba-385682;
-20-cidade universitaria,bancarios,cacuia,cocota,freguesia,galeao,jardim carioca,jardim guanabara,monero,pitangueiras,portuguesa,praia da bandeira,ribeira,taua,zumbi,ilha do governador-204610;
-21-paqueta-3361;
-22-anchieta,guadalupe,parque anchieta,ricardo de albuquerque-117543;
-23-santa teresa-40926;
-24-barra da tijuca,camorim,grumari,itanhanga,joa,recreio dos bandeirantes,vargem grande,vargem pequena-336493;
-25-acari,barros filho,coelho neto,costa barros,parque columbia,pavuna-108880;
-26-guaratiba,barra de guaratiba,pedra de guaratiba-158867;
-27-rocinha-69356;
-28-jacarezinho-33829;
-29-complexo do alemao-64715;
-30-mare-129909;
-31-cordovil,jardim america,parada de lucas,vigario geral-125431;
-33-deodoro,magalhaes bastos,realengo,jardim sulacap,campo dos afonsos,vila militar-339278;
-34-cidade de deus-50411;"""
-
-## porcentagem de religiosos por área administrativa http://www.armazemdedados.rio.rj.gov.br/arquivos/1351_propor%C3%A7%C3%A3o%20de%20pessoas%20evang%C3%A9licas%20em%20rela%C3%A7%C3%A3o%20ao%20total%20da%20popula%C3%A7%C3%A3o%20-%202000.JPG
-
-rel = """1-10/14;
-2-0/10;
-3-10/14;
-4-0/10;
-5-0/10;
-6-0/10;
-7-15/19;
-8-10/14;
-9-0/10;
-10-15/19;
-11-15/19;
-12-15/19;
-13-10/14;
-14-15/19;
-15-15/19;
-16-15/19;
-17-25/100;
-18-25/100;
-19-25/100;
-20-15/19;
-21-0/10;
-22-25/100;
-23-10/14;
-24-10/14;
-25-20/24;
-26-25/100;
-27-10/14;
-28-25/100;
-29-20/24;
-30-20/24;
-31-15/19;
-33-20/24;
-34-15/19;"""
-
-## bairros de zonas eleitorais http://www.tre-rj.jus.br/site/consultas/logradouro/lista_endereco.jsp
-ze = """
-1-saude;
-2-saude;
-3-laranjeiras;
-4-jardim botanico;
-5-copacabana;
-6-maracana;
-7-tijuca;
-8-engenho novo;
-9-barra da tijuca;
-10-piedade;
-11-olaria;
-12-cascadura;
-13-barra da tijuca;
-14-todos os santos;
-15-marechal hermes;
-16-laranjeiras;
-17-jardim botanico;
-18-copacabana;
-19-maracana;
-20-meier;
-21-olaria;
-22-iraja;
-23-marechal hermes;
-24-bangu;
-25-santa cruz;
-117-ilha do governador;
-118-cascadura;
-119-barra da tijuca;
-120-campo grande;
-121-ramos;
-122-campo grande;
-123-deodoro;
-124-bangu;
-125-santa cruz;
-160-olaria;
-161-olaria;
-162-olaria;
-163-catete;
-164-laranjeiras;
-165-jardim botanico;
-166-jardim botanico;
-167-guadalupe;
-168-del castilho;
-169-higienopolis;
-170-maracana;
-171-tijuca;
-173-vila isabel;
-175-guadalupe;
-176-iraja;
-177-parada de lucas;
-178-deodoro;
-179-barra da tijuca;
-180-taquara;
-182-taquara;
-185-praca seca;
-188-olaria;
-189-vila da penha;
-190-iraja;
-191-ilha do governador;
-192-portuguesa;
-193-saude;
-204-saude;
-205-copacabana;
-206-copacabana;
-207-todos os santos;
-208-todos os santos;
-209-taquara;
-210-taquara;
-211-jardim botanico;
-212-jardim botanico;
-213-meier;
-214-meier;
-215-del castilho;
-216-del castilho;
-217-marechal hermes;
-218-cascadura;
-219-cascadura;
-220-cascadura;
-228-maracana;
-229-estacio;
-230-bangu;
-231-bangu;
-232-bangu;
-233-bangu;
-234-bangu;
-235-bangu;
-236-bangu;
-237-bangu;
-238-bangu;
-240-santa cruz;
-241-santa cruz;
-242-campo grande;
-243-santa cruz;
-244-campo grande;
-245-campo grande;
-246-santa cruz;
-252-copacabana;"""
-
-## renda por bairro http://www.armazemdedados.rio.rj.gov.br/arquivos/1729_rendimento%20familiar%20segundo%20bairros%20-2010.XLS
-renda = """
-abolicao,agua santa,encantado-1114.99;
-acari,parque columbia-560.38;
-alto da boa vista,tijuca,praca da bandeira-3023.42;
-anchieta-670.77;
-andarai-1942.47;
-anil,gardenia azul-1634.27;
-bancarios,freguesia-998.86;
-bangu-653.26;
-barra da tijuca-5940.31;
-barra de guaratiba,guaratiba,pedra de guaratiba-556.62;
-barros filho,costa barros-366.90;
-benfica,mangueira-577.60;
-bento ribeiro-978.93;
-bonsucesso-967.84;
-botafogo-3759.53;
-bras de pina-834.67;
-cachambi-1558.40;
-cacuia,cocota,pitangueiras,praia da bandeira,ribeira,zumbi-1232.26;
-caju,gamboa,santo cristo,saude-505.50;
-camorim,vargem grande,vargem pequena-943.58;
-campinho,oswaldo cruz-984.93;
-campo dos afonsos,deodoro,jardim sulacap,vila militar-1279.35;
-campo grande-878.61;
-cascadura,cavalcante,engenheiro leal-770.74;
-catete,gloria-2298.87;
-centro-1533.38;
-cidade de deus-517.99;
-cidade nova,catumbi,estacio-869.58;
-coelho neto-670.83;
-colegio-628.72;
-complexo do alemao-390.93;
-copacabana-3768.69;
-cordovil-683.22;
-cosme velho,laranjeiras-3886.05;
-cosmos-526.78;
-curicica-881.78;
-del castilho,higienopolis,maria da graca-1090.60;
-engenho da rainha-1001.80;
-engenho de dentro-1180.61;
-engenho novo-1196.17;
-flamengo-4796.83;
-freguesia de jacarepagua-1942.76;
-galeao-841.90;
-gavea,jardim botanico-6098.88;
-grajau-2619.71;
-guadalupe-673.81;
-honorio gurgel-746.54;
-humaita-4162.33;
-inhauma-594.88;
-inhoaiba-506.05;
-ipanema-6323.26;
-iraja,vista alegre-1099.34;
-itanhanga-1387.77;
-jacare,riachuelo,rocha,sampaio,sao francisco xavier-1122.58;
-jacarepagua-1049.42;
-jacarezinho-405.49;
-jardim america-821.70;
-jardim carioca-1015.82;
-jardim guanabara-2768.64;
-lagoa-7239.50;
-leblon-5805.42;
-leme-3873.67;
-lins de vasconcelos-1256.65;
-madureira-980.13;
-magalhaes bastos-815.67;
-manguinhos-439.96;
-maracana-3238.76;
-mare-456.72;
-marechal hermes-755.59;
-meier-2236.11;
-monero,portuguesa-1517.13;
-olaria-1078.00;
-paciencia-517.56;
-padre miguel-747.16;
-paqueta-1011.52;
-parada de lucas-561.23;
-parque anchieta-810.80;
-pavuna-622.69;
-pechincha-1629.42;
-penha-728.07;
-penha circular-944.76;
-piedade-973.30;
-pilares-783.01;
-praca seca-1073.14;
-quintino bocaiuva-986.73;
-ramos-1022.91;
-realengo-768.54;
-recreio dos bandeirantes-2918.19;
-ricardo de albuquerque-577.55;
-rio comprido-1418.24;
-rocha miranda-846.46;
-rocinha-455.67;
-santa cruz-509.71;
-santa teresa-1281.08;
-santissimo-613.97;
-sao cristovao,vasco da gama-851.89;
-senador camara-572.69;
-senador vasconcelos-661.66;
-sepetiba-506.16;
-tanque-1020.04;
-taquara-1154.20;
-taua-901.68;
-todos os santos-2098.82;
-tomas coelho-791.92;
-turiacu,vaz lobo-788.18;
-vicente de carvalho,vila kosmos-887.90;
-vidigal,sao conrado-3054.83;
-vigario geral-508.27;
-vila da penha-1615.80;
-vila isabel-2105.87;
-vila valqueire-1563.04;
-"""
@@ -0,0 +1,222 @@
+"""Modelo em memória da base de candidatos, para consultas sem database.
+
+Exemplo:
+
+    import modelo
+
+    base = modelo.carrega(['VOTACAO_CANDIDATO_MUN_ZONA_2016_RJ.txt'])
+    for eleicao_id in base.eleicoes(60011, codigo_cargo=11):
+        print(base.mais_votados(eleicao_id, 179, quantidade=3))
+"""
+
+import collections
+import heapq
+import math
+
+import main
+import referencia
+
+
+class Modelo(object):
+    """Dimensões e votações recuperadas da base, com índices para consultas.
+
+    As votações não são guardadas: seus votos são somados por eleição, zona
+    e candidato à medida que os lotes são adicionados, e por eleição, zona e
+    partido em agregados, um main.Agregados. Com os índices por zona,
+    candidato, partido e município, as consultas não percorrem as votações.
+    """
+
+    def __init__(self, dimensoes):
+        self.dimensoes = dimensoes
+        self.renda_por_zona = {}
+        self.agregados = main.Agregados()
+        # Candidatos indexados por id - 1.
+        self._candidatos = []
+        self._eleicao_ids_por_municipio = collections.defaultdict(list)
+        self._candidato_ids_por_partido = collections.defaultdict(list)
+        # Votos por eleição, indexados pelo número da zona e depois pelo id
+        # do candidato.
+        self._votos_por_zona = collections.defaultdict(
+            lambda: collections.defaultdict(collections.Counter))
+        # Votos de agregados por eleição, indexados pelo número da zona e
+        # depois pelo número do partido. Refeito na primeira consulta depois
+        # de adiciona.
+        self._votos_partidos_por_zona = None
+        self._votos_por_candidato = collections.defaultdict(
+            collections.Counter)
+        self._eleicoes_indexadas = 0
+
+    def adiciona(self, votacoes):
+        """Indexa um lote de votações e as dimensões novas.
+
+        Os candidatos de dimensoes devem ter ids consecutivos a partir de 1,
+        na ordem do dict, como na leitura por main.recupera_arquivos.
+        """
+        self._indexa_dimensoes()
+        self.agregados.adiciona(votacoes, self.dimensoes.candidato_por_chave)
+        self._votos_partidos_por_zona = None
+
+        candidatos = self._candidatos
+        votos_por_zona = self._votos_por_zona
+        votos_por_candidato = self._votos_por_candidato
+        for numero_zona, candidato_id, total_votos in zip(
+                votacoes.numeros_zona, votacoes.candidato_ids,
+                votacoes.totais_votos):
+            votos_por_zona[candidatos[candidato_id - 1].eleicao_id][
+                numero_zona][candidato_id] += total_votos
+            votos_por_candidato[candidato_id][numero_zona] += total_votos
+
+    def define_rendas(self, rendas):
+        """Define as rendas das zonas, uma lista de main.Renda."""
+        self.renda_por_zona = main.renda_por_zona(rendas)
+
+    def eleicoes(self, codigo_municipio, codigo_cargo=None, num_turno=None):
+        """Retorna os ids das eleições do município.
+
+        Com codigo_cargo ou num_turno, retorna apenas as eleições do cargo ou
+        do turno.
+        """
+        eleicoes_por_id = self.dimensoes.eleicoes_por_id
+        return [
+            eleicao_id
+            for eleicao_id in self._eleicao_ids_por_municipio.get(
+                codigo_municipio, [])
+            if codigo_cargo in (None,
+                                eleicoes_por_id[eleicao_id].codigo_cargo) and
+            num_turno in (None, eleicoes_por_id[eleicao_id].num_turno)
+        ]
+
+    def candidato(self, candidato_id):
+        """Retorna o Candidato com o id."""
+        return self._candidatos[candidato_id - 1]
+
+    def candidatos_do_partido(self, eleicao_id, numero_partido):
+        """Retorna a lista dos Candidato do partido na eleição."""
+        return [
+            self.candidato(candidato_id)
+            for candidato_id in self._candidato_ids_por_partido.get(
+                (eleicao_id, numero_partido), [])
+        ]
+
+    def zonas(self, eleicao_id):
+        """Retorna os números das zonas com votações na eleição."""
+        return sorted(self._votos_por_zona.get(eleicao_id, {}))
+
+    def votos_por_zona(self, candidato_id):
+        """Retorna dict do número da zona para os votos do candidato."""
+        return dict(self._votos_por_candidato.get(candidato_id, {}))
+
+    def mais_votados(self, eleicao_id, numero_zona, quantidade=10):
+        """Retorna os candidatos mais votados na zona.
+
+        Retorna lista de (Candidato, total_votos), do mais para o menos
+        votado.
+        """
+        votos = self._votos_por_zona.get(eleicao_id, {}).get(numero_zona, {})
+        return [(self.candidato(candidato_id), total_votos)
+                for candidato_id, total_votos in heapq.nlargest(
+                    quantidade, votos.items(), key=lambda item: item[1])]
+
+    def participacao_partidos(self, eleicao_id, numero_zona):
+        """Retorna dict do número do partido para sua fração dos votos.
+
+        As frações são relativas aos votos nominais da zona na eleição.
+        """
+        votos = self._votos_partidos().get(eleicao_id, {}).get(
+            numero_zona, {})
+        total = sum(votos.values())
+        return {
+            numero_partido: total_votos / total
+            for numero_partido, total_votos in votos.items()
+        } if total else {}
+
+    def correlacao_renda(self, eleicao_id, numero_partido):
+        """Retorna a correlação entre a renda e a votação do partido.
+
+        É o coeficiente de Pearson entre a renda das zonas e a fração dos
+        votos da zona dada ao partido, nas zonas da eleição com renda. Retorna
+        None se houver menos de duas zonas ou se uma das séries for constante.
+        """
+        codigo_municipio = self.dimensoes.eleicoes_por_id[
+            eleicao_id].codigo_municipio
+        pares = []
+        for numero_zona, votos in self._votos_partidos().get(
+                eleicao_id, {}).items():
+            renda = self.renda_por_zona.get((codigo_municipio, numero_zona))
+            total = sum(votos.values())
+            if renda is not None and total:
+                pares.append((renda, votos[numero_partido] / total))
+        return correlacao(pares)
+
+    def _votos_partidos(self):
+        if self._votos_partidos_por_zona is None:
+            votos = collections.defaultdict(
+                lambda: collections.defaultdict(collections.Counter))
+            for (eleicao_id, numero_zona, numero_partido), total_votos in (
+                    self.agregados.votos_por_zona.items()):
+                votos[eleicao_id][numero_zona][numero_partido] = total_votos
+            self._votos_partidos_por_zona = votos
+        return self._votos_partidos_por_zona
+
+    def _indexa_dimensoes(self):
+        eleicoes_por_id = self.dimensoes.eleicoes_por_id
+        for eleicao_id, eleicao in main.ultimas_entradas(
+                eleicoes_por_id,
+                len(eleicoes_por_id) - self._eleicoes_indexadas):
+            self._eleicao_ids_por_municipio[eleicao.codigo_municipio].append(
+                eleicao_id)
+        self._eleicoes_indexadas = len(eleicoes_por_id)
+
+        candidato_por_chave = self.dimensoes.candidato_por_chave
+        for _, candidato in main.ultimas_entradas(
+                candidato_por_chave,
+                len(candidato_por_chave) - len(self._candidatos)):
+            self._candidatos.append(candidato)
+            self._candidato_ids_por_partido[
+                candidato.eleicao_id, candidato.numero_partido].append(
+                    candidato.id)
+
+
+def correlacao(pares):
+    """Retorna o coeficiente de Pearson de uma lista de pares (x, y).
+
+    Retorna None se houver menos de dois pares ou se x ou y for constante.
+    """
+    if len(pares) < 2:
+        return None
+    media_x = sum(x for x, _ in pares) / len(pares)
+    media_y = sum(y for _, y in pares) / len(pares)
+    covariancia = sum((x - media_x) * (y - media_y) for x, y in pares)
+    variancia_x = sum((x - media_x)**2 for x, _ in pares)
+    variancia_y = sum((y - media_y)**2 for _, y in pares)
+    if not variancia_x or not variancia_y:
+        return None
+    return covariancia / math.sqrt(variancia_x * variancia_y)
+
+
+def carrega(caminhos,
+            tamanho_lote=main.TAMANHO_LOTE_PADRAO,
+            processos=1,
+            cache=None,
+            diretorio_referencia=referencia.DIRETORIO_PADRAO):
+    """Lê os arquivos da base e retorna o Modelo, sem usar a database.
+
+    caminhos são aceitos por main.lista_arquivos, e os demais parâmetros são
+    os das opções de mesmo nome de main.py. As rendas das zonas vêm dos dados
+    de referência em diretorio_referencia.
+    """
+    dimensoes = main.Dimensoes()
+    modelo = Modelo(dimensoes)
+    for votacoes in main.recupera_arquivos(
+            main.lista_arquivos(caminhos), dimensoes, tamanho_lote, processos,
+            True, cache):
+        modelo.adiciona(votacoes)
+
+    dados_referencia = referencia.DadosReferencia(diretorio_referencia)
+    codigos_municipio = sorted(
+        {municipio.codigo_municipio
+         for municipio in dimensoes.municipios} &
+        set(dados_referencia.municipios()))
+    zonas = main.recupera_zonas_eleitorais(dados_referencia, codigos_municipio)
+    modelo.define_rendas(main.recupera_rendas(zonas, dados_referencia))
+    return modelo
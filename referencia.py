@@ -0,0 +1,202 @@
+"""Dados de referência dos municípios, lidos de arquivos CSV.
+
+Cada município tem um diretório <diretorio>/<codigo_municipio> com:
+
+    zonas.csv: numero_zona, bairro
+        Bairros das zonas eleitorais.
+    rendas.csv: bairro, valor_renda
+        Renda por bairro.
+    regioes.csv: numero_regiao, populacao, evangelicos_minimo,
+                 evangelicos_maximo
+        Regiões administrativas, com sua população e a faixa percentual de
+        evangélicos.
+    regioes_bairros.csv: numero_regiao, bairro
+        Bairros de cada região administrativa.
+
+Qualquer um dos arquivos pode faltar. Os dados do Rio de Janeiro (60011) vêm
+de:
+    zonas: http://www.tre-rj.jus.br/site/consultas/logradouro/lista_endereco.jsp
+    rendas: http://www.armazemdedados.rio.rj.gov.br/arquivos/1729_rendimento%20familiar%20segundo%20bairros%20-2010.XLS
+    regiões: https://pt.wikipedia.org/wiki/Regi%C3%B5es_administrativas_da_cidade_do_Rio_de_Janeiro
+    evangélicos: http://www.armazemdedados.rio.rj.gov.br/arquivos/1351_propor%C3%A7%C3%A3o%20de%20pessoas%20evang%C3%A9licas%20em%20rela%C3%A7%C3%A3o%20ao%20total%20da%20popula%C3%A7%C3%A3o%20-%202000.JPG
+"""
+
+import collections
+import csv
+import os
+import unicodedata
+
+# Diretório com os dados de referência distribuídos com a carga.
+DIRETORIO_PADRAO = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'referencia')
+
+# Nomes alternativos de bairros, já normalizados, para o nome usado nos dados
+# de renda.
+ALIASES_BAIRRO = {
+    'alemao': 'complexo do alemao',
+    'barra': 'barra da tijuca',
+    'complexo da mare': 'mare',
+    'freguesia (ilha do governador)': 'freguesia',
+    'freguesia (jacarepagua)': 'freguesia de jacarepagua',
+    'ilha do fundao': 'cidade universitaria',
+    'osvaldo cruz': 'oswaldo cruz',
+    'quintino': 'quintino bocaiuva',
+    'recreio': 'recreio dos bandeirantes',
+    'tomaz coelho': 'tomas coelho',
+    'vila cosmos': 'vila kosmos',
+}
+
+
+class RegiaoAdministrativa(
+        collections.namedtuple('RegiaoAdministrativa', [
+            'codigo_municipio', 'numero_regiao', 'populacao',
+            'evangelicos_minimo', 'evangelicos_maximo', 'bairros'
+        ])):
+    """Representa uma região administrativa de um município."""
+
+
+def normaliza_bairro(nome):
+    """Normaliza o nome de um bairro para comparação.
+
+    Remove acentos, ignora maiúsculas e espaços repetidos ou nas pontas e
+    troca aliases conhecidos pelo nome de ALIASES_BAIRRO.
+    """
+    decomposto = unicodedata.normalize('NFKD', nome)
+    sem_acentos = ''.join(
+        caractere for caractere in decomposto
+        if not unicodedata.combining(caractere))
+    normalizado = ' '.join(sem_acentos.casefold().split())
+    return ALIASES_BAIRRO.get(normalizado, normalizado)
+
+
+class IndiceBairros(object):
+    """Renda por bairro, buscada pelo nome normalizado do bairro.
+
+    rendas são tuplas (codigo_municipio, bairro, valor_renda) e regioes são
+    tuplas (codigo_municipio, bairros) com os bairros de cada região
+    administrativa. Um bairro sem renda própria recebe a média das rendas dos
+    bairros da sua região.
+    """
+
+    def __init__(self, rendas, regioes=()):
+        self._renda_por_bairro = {}
+        for codigo_municipio, bairro, valor_renda in rendas:
+            self._renda_por_bairro[codigo_municipio,
+                                   normaliza_bairro(bairro)] = valor_renda
+
+        self._renda_por_regiao = {}
+        for codigo_municipio, bairros in regioes:
+            chaves = [(codigo_municipio, normaliza_bairro(bairro))
+                      for bairro in bairros]
+            valores = [
+                self._renda_por_bairro[chave] for chave in chaves
+                if chave in self._renda_por_bairro
+            ]
+            if valores:
+                for chave in chaves:
+                    self._renda_por_regiao.setdefault(
+                        chave, sum(valores) / len(valores))
+
+    def renda(self, codigo_municipio, bairro):
+        """Retorna a renda do bairro, ou None se for desconhecida."""
+        chave = codigo_municipio, normaliza_bairro(bairro)
+        valor_renda = self._renda_por_bairro.get(chave)
+        if valor_renda is None:
+            valor_renda = self._renda_por_regiao.get(chave)
+        return valor_renda
+
+
+class DadosReferencia(object):
+    """Dados de referência dos municípios de um diretório.
+
+    Os arquivos de um município são lidos uma única vez, na primeira consulta
+    a ele. As consultas são indexadas por (codigo_municipio, numero_zona) e
+    (codigo_municipio, bairro).
+    """
+
+    def __init__(self, diretorio=DIRETORIO_PADRAO):
+        self.diretorio = diretorio
+        self._zonas = {}
+        self._bairro_por_zona = {}
+        self._regioes = {}
+        self._regiao_por_bairro = {}
+        self._indices = {}
+
+    def municipios(self):
+        """Retorna os códigos dos municípios com dados de referência."""
+        if not os.path.isdir(self.diretorio):
+            return []
+        return sorted(
+            int(nome) for nome in os.listdir(self.diretorio)
+            if nome.isdigit())
+
+    def zonas(self, codigo_municipio):
+        """Retorna lista de (numero_zona, bairro) do município."""
+        self._carrega(codigo_municipio)
+        return self._zonas[codigo_municipio]
+
+    def bairro(self, codigo_municipio, numero_zona):
+        """Retorna o bairro da zona, ou None se for desconhecido."""
+        self._carrega(codigo_municipio)
+        return self._bairro_por_zona.get((codigo_municipio, numero_zona))
+
+    def renda(self, codigo_municipio, bairro):
+        """Retorna a renda do bairro, ou None se for desconhecida."""
+        self._carrega(codigo_municipio)
+        return self._indices[codigo_municipio].renda(codigo_municipio, bairro)
+
+    def regioes(self, codigo_municipio):
+        """Retorna lista das RegiaoAdministrativa do município."""
+        self._carrega(codigo_municipio)
+        return self._regioes[codigo_municipio]
+
+    def regiao(self, codigo_municipio, bairro):
+        """Retorna o número da região do bairro, ou None se for desconhecida.
+
+        Um bairro listado em mais de uma região pertence à primeira delas.
+        """
+        self._carrega(codigo_municipio)
+        return self._regiao_por_bairro.get(
+            (codigo_municipio, normaliza_bairro(bairro)))
+
+    def _carrega(self, codigo_municipio):
+        if codigo_municipio in self._zonas:
+            return
+
+        zonas = [(int(linha['numero_zona']), linha['bairro'])
+                 for linha in self._le(codigo_municipio, 'zonas.csv')]
+        for numero_zona, bairro in zonas:
+            self._bairro_por_zona[codigo_municipio, numero_zona] = bairro
+
+        bairros_por_regiao = collections.defaultdict(list)
+        for linha in self._le(codigo_municipio, 'regioes_bairros.csv'):
+            numero_regiao = int(linha['numero_regiao'])
+            bairros_por_regiao[numero_regiao].append(linha['bairro'])
+            self._regiao_por_bairro.setdefault(
+                (codigo_municipio, normaliza_bairro(linha['bairro'])),
+                numero_regiao)
+        regioes = [
+            RegiaoAdministrativa(
+                codigo_municipio, int(linha['numero_regiao']),
+                int(linha['populacao']), float(linha['evangelicos_minimo']),
+                float(linha['evangelicos_maximo']),
+                bairros_por_regiao[int(linha['numero_regiao'])])
+            for linha in self._le(codigo_municipio, 'regioes.csv')
+        ]
+
+        rendas = [(codigo_municipio, linha['bairro'],
+                   float(linha['valor_renda']))
+                  for linha in self._le(codigo_municipio, 'rendas.csv')]
+        self._indices[codigo_municipio] = IndiceBairros(
+            rendas, [(codigo_municipio, bairros)
+                     for bairros in bairros_por_regiao.values()])
+        self._regioes[codigo_municipio] = regioes
+        self._zonas[codigo_municipio] = zonas
+
+    def _le(self, codigo_municipio, nome):
+        """Retorna as linhas do arquivo do município como dicts."""
+        caminho = os.path.join(self.diretorio, str(codigo_municipio), nome)
+        if not os.path.exists(caminho):
+            return []
+        with open(caminho, newline='', encoding='utf-8') as entrada:
+            return list(csv.DictReader(entrada))